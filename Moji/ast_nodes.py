@@ -8,25 +8,63 @@ The AST is the hierarchical representation of the source code,
 created by the Parser and read by the Interpreter.
 """
 
+from .token import TT_NAMES
+
+################################################################################
+# 1. VARIABLE SLOTS
+# Every name (variable or function) gets a small integer "slot" the first
+# time a node referring to it is built. The Interpreter keeps its values in
+# a list indexed by slot, so reading a variable is a list index instead of
+# a dictionary lookup by name.
+################################################################################
+
+class SlotTable:
+    """
+    The slots of one program. The Parser fills it while building the nodes
+    and the ProgramNode carries it, so the Interpreter can size its frame.
+    Modules imported by ⚙️ are parsed into the importer's table, which keeps
+    the slots of a name the same in both.
+    """
+    __slots__ = ('names', '_slots')
+
+    def __init__(self):
+        self.names = []   # slot -> name
+        self._slots = {}  # name -> slot
+
+    def slot_for(self, name):
+        """ Returns the slot of 'name', assigning a new one on first use. """
+        slot = self._slots.get(name)
+        if slot is None:
+            slot = self._slots[name] = len(self.names)
+            self.names.append(name)
+        return slot
+
 ################################################################################
-# 1. BASE NODES
+# 2. BASE NODES
 ################################################################################
 
 class Node:
     """ Base class for all AST nodes. """
+    __slots__ = ()
+    # Visitor function cached by the interpreter (see interpreter._install_visitors).
+    _visit_fn = None
+
     def __repr__(self):
         return f'({self.__class__.__name__})'
 
 class ProgramNode(Node):
     """ Root node of the AST. Represents the entire program. """
-    def __init__(self, statements):
+    __slots__ = ('statements', 'slot_table')
+    def __init__(self, statements, slot_table):
         self.statements = statements # A list of statement nodes
+        self.slot_table = slot_table # SlotTable the nodes were built with
 
     def __repr__(self):
         return f'ProgramNode(\n  {self.statements}\n)'
 
 class BlockNode(Node):
     """ Represents a code block 📦 ... 📦⛔. """
+    __slots__ = ('statements',)
     def __init__(self, statements):
         self.statements = statements # A list of statement nodes
 
@@ -34,11 +72,12 @@ class BlockNode(Node):
         return f'BlockNode(\n  {self.statements}\n)'
 
 ################################################################################
-# 2. EXPRESSION NODES (Things that have a value)
+# 3. EXPRESSION NODES (Things that have a value)
 ################################################################################
 
 class NumberNode(Node):
     """ Represents a numeric literal (Integer or Real). """
+    __slots__ = ('token', 'value')
     def __init__(self, token):
         self.token = token
         self.value = token.value
@@ -48,6 +87,7 @@ class NumberNode(Node):
 
 class StringNode(Node):
     """ Represents a string literal. """
+    __slots__ = ('token', 'value')
     def __init__(self, token):
         self.token = token
         self.value = token.value
@@ -57,34 +97,39 @@ class StringNode(Node):
 
 class VarAccessNode(Node):
     """ Represents accessing (reading) a variable. """
-    def __init__(self, var_name_token):
+    __slots__ = ('var_name_token', 'var_name', 'slot')
+    def __init__(self, var_name_token, slot_table):
         self.var_name_token = var_name_token
         self.var_name = var_name_token.value
+        self.slot = slot_table.slot_for(self.var_name)
 
     def __repr__(self):
         return f'VarAccess({self.var_name})'
 
 class BinOpNode(Node):
     """ Represents a binary operation (e.g., 1 ➕ 2, x ⚖️ 10). """
+    __slots__ = ('left_node', 'op_token', 'right_node')
     def __init__(self, left_node, op_token, right_node):
         self.left_node = left_node
         self.op_token = op_token
         self.right_node = right_node
 
     def __repr__(self):
-        return f'({self.left_node} {self.op_token.type} {self.right_node})'
+        return f'({self.left_node} {TT_NAMES[self.op_token.type]} {self.right_node})'
 
 class UnaryOpNode(Node):
     """ Represents a unary operation (e.g., 🚫 x). """
+    __slots__ = ('op_token', 'node')
     def __init__(self, op_token, node):
         self.op_token = op_token
         self.node = node
 
     def __repr__(self):
-        return f'({self.op_token.type} {self.node})'
+        return f'({TT_NAMES[self.op_token.type]} {self.node})'
 
 class FuncCallNode(Node):
     """ Represents a function call (e.g., 📞 myFunc arg1 arg2). """
+    __slots__ = ('node_to_call', 'arg_nodes')
     def __init__(self, node_to_call, arg_nodes):
         # node_to_call is usually a VarAccessNode (the function name)
         self.node_to_call = node_to_call
@@ -95,6 +140,7 @@ class FuncCallNode(Node):
 
 class ListAccessNode(Node): # (NOVO)
     """ Represents accessing a list index (e.g., myList 🎯 0). """
+    __slots__ = ('list_node', 'index_node')
     def __init__(self, list_node, index_node):
         self.list_node = list_node
         self.index_node = index_node
@@ -104,6 +150,7 @@ class ListAccessNode(Node): # (NOVO)
 
 class FileReadNode(Node): # (NOVO)
     """ Represents reading a file (e.g., 📖 "data.txt"). """
+    __slots__ = ('filename_node',)
     def __init__(self, filename_node):
         self.filename_node = filename_node
 
@@ -112,37 +159,54 @@ class FileReadNode(Node): # (NOVO)
 
 class TypeCastNode(Node): # (NOVO)
     """ Represents type conversion (e.g., 🔢 "123"). """
+    __slots__ = ('type_token', 'expression_node')
     def __init__(self, type_token, expression_node):
         self.type_token = type_token
         self.expression_node = expression_node
 
     def __repr__(self):
-        return f'Cast(to {self.type_token.type} value: {self.expression_node})'
+        return f'Cast(to {TT_NAMES[self.type_token.type]} value: {self.expression_node})'
+
+class StringConcatNode(Node): # (NOVO)
+    """
+    Represents a chain of ➕ that concatenates text (e.g., "Olá, " ➕ nome ➕ "!").
+    Built by the optimizer; every part is converted to str and joined at once.
+    """
+    __slots__ = ('parts',)
+    def __init__(self, parts):
+        self.parts = parts
+
+    def __repr__(self):
+        return f'Concat({self.parts})'
 
 
 ################################################################################
-# 3. STATEMENT NODES (Things that perform an action)
+# 4. STATEMENT NODES (Things that perform an action)
 ################################################################################
 
 class VarDeclareNode(Node):
     """
     Variable declaration (e.g., 🔢 x 🔚 or 🔢 x 👉 10 🔚).
     """
-    def __init__(self, var_type_token, var_name_token, value_node=None):
+    __slots__ = ('var_type_token', 'var_name_token', 'value_node', 'slot')
+    def __init__(self, var_type_token, var_name_token, value_node, slot_table):
         self.var_type_token = var_type_token
         self.var_name_token = var_name_token
         self.value_node = value_node # Expression node (e.g., NumberNode) or None
+        self.slot = slot_table.slot_for(var_name_token.value)
 
     def __repr__(self):
         if self.value_node:
-            return f'Declare({self.var_name_token.value} as {self.var_type_token.type} = {self.value_node})'
-        return f'Declare({self.var_name_token.value} as {self.var_type_token.type})'
+            return f'Declare({self.var_name_token.value} as {TT_NAMES[self.var_type_token.type]} = {self.value_node})'
+        return f'Declare({self.var_name_token.value} as {TT_NAMES[self.var_type_token.type]})'
 
 class VarAssignNode(Node):
     """ Variable re-assignment (e.g., x 👉 20 🔚). """
-    def __init__(self, var_name_token, value_node):
+    __slots__ = ('var_name_token', 'var_name', 'slot', 'value_node')
+    def __init__(self, var_name_token, value_node, slot_table):
         self.var_name_token = var_name_token
         self.var_name = var_name_token.value
+        self.slot = slot_table.slot_for(self.var_name)
         self.value_node = value_node # Expression node
 
     def __repr__(self):
@@ -150,6 +214,7 @@ class VarAssignNode(Node):
 
 class PrintNode(Node):
     """ Print statement 🖨️. """
+    __slots__ = ('node_to_print',)
     def __init__(self, node_to_print):
         self.node_to_print = node_to_print # Expression node
 
@@ -158,26 +223,32 @@ class PrintNode(Node):
 
 class ReadNode(Node):
     """ Read statement 👀. """
-    def __init__(self, var_name_token):
+    __slots__ = ('var_name_token', 'var_name', 'slot')
+    def __init__(self, var_name_token, slot_table):
         self.var_name_token = var_name_token
         self.var_name = var_name_token.value
+        self.slot = slot_table.slot_for(self.var_name)
 
     def __repr__(self):
         return f'Read({self.var_name})'
 
 class IfNode(Node):
     """ Conditional statement 🤔 ... 🔀 ... 🤨. """
-    def __init__(self, cases, else_case):
-        # cases is a list of tuples: [(condition_node, block_node), ...]
-        self.cases = cases
+    __slots__ = ('conditions', 'bodies', 'else_case')
+    def __init__(self, conditions, bodies, else_case):
+        # One entry per 'IF'/'ELIF' case, in parallel lists:
+        # conditions[i] is an expression node, bodies[i] its BlockNode
+        self.conditions = conditions
+        self.bodies = bodies
         # else_case is a BlockNode or None
         self.else_case = else_case
 
     def __repr__(self):
-        return f'If(Cases: {self.cases}, Else: {self.else_case})'
+        return f'If(Cases: {list(zip(self.conditions, self.bodies))}, Else: {self.else_case})'
 
 class WhileNode(Node): # (NOVO)
     """ While loop statement ⏳. """
+    __slots__ = ('condition_node', 'body_node')
     def __init__(self, condition_node, body_node):
         self.condition_node = condition_node
         self.body_node = body_node # A BlockNode
@@ -187,8 +258,10 @@ class WhileNode(Node): # (NOVO)
 
 class ForNode(Node): # (NOVO)
     """ For-each loop statement 🚶. """
-    def __init__(self, var_name_token, list_node, body_node):
+    __slots__ = ('var_name_token', 'slot', 'list_node', 'body_node')
+    def __init__(self, var_name_token, list_node, body_node, slot_table):
         self.var_name_token = var_name_token # Identifier token for the item
+        self.slot = slot_table.slot_for(var_name_token.value)
         self.list_node = list_node # Expression node (the list to iterate)
         self.body_node = body_node # A BlockNode
 
@@ -197,10 +270,15 @@ class ForNode(Node): # (NOVO)
 
 class FuncDefNode(Node):
     """ Function definition 🧩. """
-    def __init__(self, func_name_token, arg_name_tokens, body_node):
+    __slots__ = ('func_name_token', 'func_name', 'slot', 'arg_name_tokens', 'arg_slots', 'arg_count', 'body_node')
+    def __init__(self, func_name_token, arg_name_tokens, body_node, slot_table):
         self.func_name_token = func_name_token
         self.func_name = func_name_token.value
+        self.slot = slot_table.slot_for(self.func_name)
         self.arg_name_tokens = arg_name_tokens # List of Identifier tokens
+        # Fixed per function, so every 📞 reuses them
+        self.arg_slots = tuple(slot_table.slot_for(token.value) for token in arg_name_tokens)
+        self.arg_count = len(arg_name_tokens)
         self.body_node = body_node # A BlockNode
 
     def __repr__(self):
@@ -208,6 +286,7 @@ class FuncDefNode(Node):
 
 class ReturnNode(Node):
     """ Return statement 🔙. """
+    __slots__ = ('node_to_return',)
     def __init__(self, node_to_return):
         # node_to_return is an expression node or None
         self.node_to_return = node_to_return
@@ -217,8 +296,10 @@ class ReturnNode(Node):
 
 class ListAppendNode(Node):
     """ List append statement ➕📜. """
-    def __init__(self, list_var_token, value_node):
+    __slots__ = ('list_var_token', 'slot', 'value_node')
+    def __init__(self, list_var_token, value_node, slot_table):
         self.list_var_token = list_var_token
+        self.slot = slot_table.slot_for(list_var_token.value)
         self.value_node = value_node
 
     def __repr__(self):
@@ -226,8 +307,10 @@ class ListAppendNode(Node):
 
 class ListRemoveNode(Node):
     """ List remove statement ➖📜. """
-    def __init__(self, list_var_token, index_node):
+    __slots__ = ('list_var_token', 'slot', 'index_node')
+    def __init__(self, list_var_token, index_node, slot_table):
         self.list_var_token = list_var_token
+        self.slot = slot_table.slot_for(list_var_token.value)
         self.index_node = index_node # Expression node (the index)
 
     def __repr__(self):
@@ -235,6 +318,7 @@ class ListRemoveNode(Node):
 
 class ImportNode(Node):
     """ Import statement ⚙️. """
+    __slots__ = ('module_name_token',)
     def __init__(self, module_name_token):
         self.module_name_token = module_name_token
 
@@ -243,6 +327,7 @@ class ImportNode(Node):
 
 class SaveNode(Node):
     """ Save statement 💾. """
+    __slots__ = ('data_node', 'filename_node')
     def __init__(self, data_node, filename_node):
         self.data_node = data_node
         self.filename_node = filename_node
@@ -252,6 +337,7 @@ class SaveNode(Node):
 
 class FileAppendNode(Node): # (NOVO)
     """ File append statement ✍️. """
+    __slots__ = ('data_node', 'filename_node')
     def __init__(self, data_node, filename_node):
         self.data_node = data_node
         self.filename_node = filename_node
@@ -261,6 +347,7 @@ class FileAppendNode(Node): # (NOVO)
 
 class SleepNode(Node):
     """ Sleep statement ⏱️. """
+    __slots__ = ('duration_node',)
     def __init__(self, duration_node):
         self.duration_node = duration_node
 
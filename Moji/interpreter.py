@@ -1,37 +1,62 @@
 # moji/interpreter.py
 
-import time
+import os
 
 # Import all nodes, as the interpreter needs to know how to "visit" each one
+from . import ast_nodes
 from .ast_nodes import *
 # Import token types for checking (e.g., operation type)
 from .token import (
-    TT_OP_PLUS, TT_OP_MINUS, TT_OP_MUL, TT_OP_DIV,
-    TT_COMP_EQ, TT_COMP_GT, TT_COMP_LT, TT_LOGIC_NOT,
+    TT_LOGIC_NOT,
     TT_KEYWORD_INT, TT_KEYWORD_REAL, TT_KEYWORD_STRING, TT_KEYWORD_LIST,
-    # (NOVOS TOKENS)
-    TT_LOGIC_AND, TT_LOGIC_OR
+    TT_NAMES
 )
+# Runtime errors and the functions behind each binary operator
+from .operations import RuntimeError, BINARY_OPERATIONS
+from .optimizer import fold_constants
 
 
 ################################################################################
-# 1. RUNTIME ERROR & RETURN SIGNAL
+# 1. RETURN SIGNAL
 ################################################################################
 
-class RuntimeError(Exception):
-    def __init__(self, message):
-        # Errors that happen during the *execution* of Moji code
-        super().__init__(f"Runtime Error: {message}")
+# (ATUALIZADO) Sinal de retorno: quando o comando 🔙 (return) é executado, o
+# visitor devolve este objeto (e guarda o valor em 'Interpreter._return_value').
+# Cada comando que executa outros comandos repassa o sinal para cima até
+# chegar na chamada da função 📞, sem o custo de lançar uma exceção.
+_RETURN = object()
 
 
-class ReturnSignal(Exception):  # (NOVO)
-    """
-    Uma exceção especial usada para "pular" para fora da execução de uma
-    função quando o comando 🔙 (return) é encontrado.
-    """
+# Marks a frame slot whose variable was never declared (or went out of scope).
+UNDEFINED = object()
+
+# (NOVO) Módulos já lidos por ⚙️ (Importar): caminho real -> ((mtime, tamanho),
+# AST). Importar o mesmo arquivo de novo, sem alterações, não repete o
+# Lexer e o Parser (o módulo ainda é executado, como antes).
+_IMPORT_CACHE = {}
+
 
-    def __init__(self, value):
-        self.value = value
+# (NOVO) Type keyword -> conversion used by 🔢/👽/💬 (Type Cast). Called
+# with no argument, it also builds the default value of a declaration
+# (0, 0.0, ""); lists (📜) only take part in the latter.
+TYPE_CONVERSIONS = {
+    TT_KEYWORD_INT: int,
+    TT_KEYWORD_REAL: float,
+    TT_KEYWORD_STRING: str,
+}
+DEFAULT_VALUE_FACTORIES = {
+    **TYPE_CONVERSIONS,
+    TT_KEYWORD_LIST: list,  # A new list for every declaration
+}
+
+
+# (NOVO) How 👀 (Read) converts the input, based on the type of the variable's
+# current value. Any other type (String, List, etc.) keeps the raw string.
+READ_CONVERTERS = {
+    int: int,
+    bool: int,  # bool is an int subclass (e.g., the result of a comparison)
+    float: float,
+}
 
 
 ################################################################################
@@ -39,9 +64,24 @@ class ReturnSignal(Exception):  # (NOVO)
 ################################################################################
 
 class Interpreter:
+    """
+    Walks the AST and executes it. The visit_NODE methods are cached on the
+    node classes (see _install_visitors), so they cannot be overridden: a
+    subclass that defines one is rejected instead of being silently ignored.
+    """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        overridden = sorted(name for name in vars(cls) if name.startswith('visit_'))
+        if overridden:
+            raise TypeError(f"{cls.__name__} cannot override the Interpreter visitors: {', '.join(overridden)}")
+
     def __init__(self):
-        # The Symbol Table (memory) that stores variables
-        self.symbol_table = {}
+        # The memory that stores variables: a list indexed by the slot the
+        # AST assigned to each name (see ast_nodes.SlotTable). Slots that were
+        # never declared hold UNDEFINED.
+        self.frame = []
+        self.slot_table = None  # Table of the program being run
+        self._return_value = None  # Valor do último 🔙 (ver _RETURN)
 
     def visit(self, node):
         """
@@ -49,21 +89,23 @@ class Interpreter:
         Calls the specific 'visit_NODE' method based on the node's type.
         E.g.: If 'node' is a 'PrintNode', it calls 'self.visit_PrintNode(node)'
         """
-        method_name = f'visit_{type(node).__name__}'
-        method = getattr(self, method_name, self.no_visit_method)
-        return method(node)
+        return type(node)._visit_fn(self, node)
 
     def no_visit_method(self, node):
         """ Fallback method if a 'visit_' is not implemented. """
         raise RuntimeError(f"No 'visit_{type(node).__name__}' method defined")
 
+    def grow_frame(self):
+        """ Makes room in the frame for every slot of the program's table. """
+        missing = len(self.slot_table.names) - len(self.frame)
+        if missing > 0:
+            self.frame.extend([UNDEFINED] * missing)
+
     def run(self, ast):
         """ Public entry point to execute the AST. """
         try:
+            ast = fold_constants(ast)
             return self.visit(ast)
-        # (ATUALIZADO) Captura o ReturnSignal no nível superior (não deve acontecer)
-        except ReturnSignal:
-            raise RuntimeError("Comando '🔙' (Return) encontrado fora de uma função 🧩.")
         except RuntimeError as e:
             # Erros de runtime já formatados
             raise e
@@ -80,24 +122,27 @@ class Interpreter:
         return node.value
 
     def visit_VarAccessNode(self, node):
-        """ Reads a value from the symbol table. """
-        var_name = node.var_name
-        value = self.symbol_table.get(var_name)
+        """ Reads a value from the frame. """
+        value = self.frame[node.slot]
 
-        if value is None:
-            raise RuntimeError(f"Variável '{var_name}' não foi definida.")
+        if value is UNDEFINED:
+            raise RuntimeError(f"Variável '{node.var_name}' não foi definida.")
 
         return value
 
     def visit_ListAccessNode(self, node):  # (NOVO)
         """ 🎯 (Acessar Índice) - Retorna um item da lista. """
-        list_val = self.visit(node.list_node)
-        index_val = self.visit(node.index_node)
-
-        if not isinstance(list_val, list):
+        list_node = node.list_node
+        index_node = node.index_node
+        list_val = type(list_node)._visit_fn(self, list_node)
+        index_val = type(index_node)._visit_fn(self, index_node)
+
+        # The exact type test settles the common case; isinstance only runs
+        # for anything else (e.g., a bool index, which is still valid)
+        if type(list_val) is not list and not isinstance(list_val, list):
             raise RuntimeError(f"Não é possível usar 🎯 (acessar índice) em algo que não é uma lista 📜.")
 
-        if not isinstance(index_val, int):
+        if type(index_val) is not int and not isinstance(index_val, int):
             raise RuntimeError(f"Índice para 🎯 (acessar índice) deve ser um inteiro 🔢.")
 
         try:
@@ -124,58 +169,81 @@ class Interpreter:
         value_to_cast = self.visit(node.expression_node)
         target_type = node.type_token.type
 
+        conversion = TYPE_CONVERSIONS.get(target_type)
+        if conversion is None:
+            raise RuntimeError(f"Conversão de tipo desconhecida: {TT_NAMES[target_type]}.")
+
         try:
-            if target_type == TT_KEYWORD_INT:
-                return int(value_to_cast)
-            elif target_type == TT_KEYWORD_REAL:
-                return float(value_to_cast)
-            elif target_type == TT_KEYWORD_STRING:
-                return str(value_to_cast)
+            return conversion(value_to_cast)
         except ValueError:
-            raise RuntimeError(f"Não foi possível converter '{value_to_cast}' para o tipo {target_type}.")
-
-        raise RuntimeError(f"Conversão de tipo desconhecida: {target_type}.")
+            raise RuntimeError(f"Não foi possível converter '{value_to_cast}' para o tipo {TT_NAMES[target_type]}.")
 
     # --- OPERATION NODES (that calculate values) ---
 
     def visit_BinOpNode(self, node):  # (ATUALIZADO)
         """ Executes binary operations (e.g., 1 ➕ 2, x ⚖️ 10, a 🤝 b). """
-        left_val = self.visit(node.left_node)
-        right_val = self.visit(node.right_node)
+        if type(node.left_node) is BinOpNode:
+            return self.eval_binop_chain(node)
+
+        left_val = self.eval_operand(node.left_node)
+        right_val = self.eval_operand(node.right_node)
+
         op_type = node.op_token.type
 
-        # Mathematical Operations
-        if op_type == TT_OP_PLUS:
-            # If one side is a string, force concatenation
-            if isinstance(left_val, str) or isinstance(right_val, str):
-                return str(left_val) + str(right_val)
-            # Otherwise, it's numeric addition
-            return left_val + right_val
-
-        elif op_type == TT_OP_MINUS:
-            return left_val - right_val
-        elif op_type == TT_OP_MUL:
-            return left_val * right_val
-        elif op_type == TT_OP_DIV:
-            if right_val == 0:
-                raise RuntimeError("Divisão por zero.")
-            return left_val / right_val
-
-        # Comparison Operations
-        elif op_type == TT_COMP_EQ:
-            return left_val == right_val
-        elif op_type == TT_COMP_GT:
-            return left_val > right_val
-        elif op_type == TT_COMP_LT:
-            return left_val < right_val
-
-        # (NOVO) Logic Operations
-        elif op_type == TT_LOGIC_AND:
-            return bool(left_val) and bool(right_val)
-        elif op_type == TT_LOGIC_OR:
-            return bool(left_val) or bool(right_val)
-
-        raise RuntimeError(f"Operador binário desconhecido: {op_type}")
+        op_func = BINARY_OPERATIONS.get(op_type)
+        if op_func is None:
+            raise RuntimeError(f"Operador binário desconhecido: {TT_NAMES[op_type]}")
+
+        return op_func(left_val, right_val)
+
+    def eval_binop_chain(self, node):  # (NOVO)
+        """
+        Executes a left-deep chain of binary operations (e.g., a ➕ b ➖ c)
+        in a loop, from the innermost operation up, instead of one
+        recursive visit per operator (long expressions would otherwise hit
+        Python's recursion limit).
+        """
+        chain = []
+        while type(node) is BinOpNode:
+            chain.append(node)
+            node = node.left_node
+        chain.reverse()
+
+        left_val = self.eval_operand(node)
+
+        for node in chain:
+            right_val = self.eval_operand(node.right_node)
+
+            op_type = node.op_token.type
+
+            op_func = BINARY_OPERATIONS.get(op_type)
+            if op_func is None:
+                raise RuntimeError(f"Operador binário desconhecido: {TT_NAMES[op_type]}")
+
+            left_val = op_func(left_val, right_val)
+
+        return left_val
+
+    def eval_operand(self, node):  # (NOVO)
+        """
+        Evaluates an operand of a binary operation. Hot path: variables are
+        read straight from the frame, literals straight from the node, and
+        anything else is dispatched through the visitor cache instead of
+        going through 'visit'.
+        """
+        node_type = type(node)
+        if node_type is VarAccessNode:
+            value = self.frame[node.slot]
+            if value is UNDEFINED:
+                self.visit_VarAccessNode(node)  # Raises the error
+            return value
+        if node_type is NumberNode or node_type is StringNode:
+            return node.value
+        return node_type._visit_fn(self, node)
+
+    def visit_StringConcatNode(self, node):  # (NOVO)
+        """ Executes a ➕ chain of texts (see optimizer) with a single join. """
+        return ''.join([str(type(part)._visit_fn(self, part)) for part in node.parts])
 
     def visit_UnaryOpNode(self, node):
         """ Executes unary operations (e.g., 🚫 x). """
@@ -185,25 +253,32 @@ class Interpreter:
         if op_type == TT_LOGIC_NOT:
             return not bool(value)  # Cast para booleano para segurança
 
-        raise RuntimeError(f"Operador unário desconhecido: {op_type}")
+        raise RuntimeError(f"Operador unário desconhecido: {TT_NAMES[op_type]}")
 
     # --- STATEMENT NODES ---
 
     def visit_ProgramNode(self, node):
         """ Executes each statement in the program. """
+        self.slot_table = node.slot_table
+        self.grow_frame()
+
+        # Each statement is dispatched straight through the visitor cache
         for statement in node.statements:
-            self.visit(statement)  # We don't expect a return value
+            # (ATUALIZADO) O sinal de retorno não deve chegar no nível superior
+            if type(statement)._visit_fn(self, statement) is _RETURN:
+                raise RuntimeError("Comando '🔙' (Return) encontrado fora de uma função 🧩.")
 
     def visit_BlockNode(self, node):
         """ Executes each statement in a block. """
         for statement in node.statements:
-            self.visit(statement)
+            if type(statement)._visit_fn(self, statement) is _RETURN:
+                return _RETURN  # Stop the block and pass the return signal up
 
     def visit_VarDeclareNode(self, node):
-        """ Creates a new variable in the symbol table. """
+        """ Creates a new variable in the frame. """
         var_name = node.var_name_token.value
 
-        if var_name in self.symbol_table:
+        if self.frame[node.slot] is not UNDEFINED:
             raise RuntimeError(f"Variável '{var_name}' já foi declarada.")
 
         # If a value was provided (e.g., 🔢 x 👉 10)
@@ -211,28 +286,18 @@ class Interpreter:
             value = self.visit(node.value_node)
         else:
             # Otherwise, use a default value based on the type
-            if node.var_type_token.type == TT_KEYWORD_INT:
-                value = 0
-            elif node.var_type_token.type == TT_KEYWORD_REAL:
-                value = 0.0
-            elif node.var_type_token.type == TT_KEYWORD_STRING:
-                value = ""
-            elif node.var_type_token.type == TT_KEYWORD_LIST:
-                value = []
-            else:
-                value = None  # Unknown type?
+            factory = DEFAULT_VALUE_FACTORIES.get(node.var_type_token.type)
+            value = None if factory is None else factory()  # None: unknown type?
 
-        self.symbol_table[var_name] = value
+        self.frame[node.slot] = value
 
     def visit_VarAssignNode(self, node):
         """ Updates the value of an existing variable. """
-        var_name = node.var_name
-
-        if var_name not in self.symbol_table:
-            raise RuntimeError(f"Variável '{var_name}' não declarada. Use 🔢, 💬, etc. para declarar.")
+        if self.frame[node.slot] is UNDEFINED:
+            raise RuntimeError(f"Variável '{node.var_name}' não declarada. Use 🔢, 💬, etc. para declarar.")
 
         value = self.visit(node.value_node)
-        self.symbol_table[var_name] = value
+        self.frame[node.slot] = value
 
     def visit_PrintNode(self, node):
         """ Prints a value to the console. """
@@ -243,122 +308,127 @@ class Interpreter:
         """ Reads user input and saves it to the variable. """
         var_name = node.var_name
 
-        if var_name not in self.symbol_table:
+        # Get the *current* type of the variable to try converting the input
+        current_value = self.frame[node.slot]
+        if current_value is UNDEFINED:
             raise RuntimeError(f"Variável '{var_name}' não declarada. Não é possível ler.")
 
-        # Get the *current* type of the variable to try converting the input
-        current_value = self.symbol_table[var_name]
         input_str = input(f"Insira o valor para {var_name}: ")
 
         try:
-            if isinstance(current_value, int):
-                new_value = int(input_str)
-            elif isinstance(current_value, float):
-                new_value = float(input_str)
-            else:
-                # If it's String, List, etc., just save the string
-                new_value = input_str
+            converter = READ_CONVERTERS.get(type(current_value))
+            # If it's String, List, etc., just save the string
+            new_value = input_str if converter is None else converter(input_str)
         except ValueError:
             raise RuntimeError(f"Entrada inválida. Esperado um tipo compatível com '{var_name}'.")
 
-        self.symbol_table[var_name] = new_value
+        self.frame[node.slot] = new_value
 
     def visit_IfNode(self, node):
         """ Executes conditional blocks (If/Elif/Else). """
         # Iterate over 'IF' and 'ELIF' blocks
-        for condition_node, body_node in node.cases:
-            condition_value = self.visit(condition_node)
+        for condition_node, body_node in zip(node.conditions, node.bodies):
+            condition_value = type(condition_node)._visit_fn(self, condition_node)
 
             if condition_value:  # If the condition is True
-                self.visit(body_node)
-                return  # Stop checking (only execute one block)
+                # Stop checking (only execute one block), passing any
+                # return signal up
+                return type(body_node)._visit_fn(self, body_node)
 
         # If no 'IF/ELIF' was true, check 'ELSE'
         if node.else_case:
-            self.visit(node.else_case)
+            return self.visit(node.else_case)
 
     def visit_WhileNode(self, node):  # (NOVO)
         """ ⏳ (Loop "While") - Executa um bloco enquanto a condição for verdadeira. """
-        while self.visit(node.condition_node):
-            self.visit(node.body_node)
+        # Locals are cheaper than attribute lookups inside the loop
+        visit = self.visit
+        condition_node = node.condition_node
+        body_node = node.body_node
+
+        while visit(condition_node):
+            if visit(body_node) is _RETURN:
+                return _RETURN
 
     def visit_ForNode(self, node):  # (NOVO)
         """ 🚶 (Loop "For Each") - Executa um bloco para cada item em uma lista. """
         list_val = self.visit(node.list_node)
-        var_name = node.var_name_token.value
+        slot = node.slot
 
-        if not isinstance(list_val, list):
+        if type(list_val) is not list and not isinstance(list_val, list):
             raise RuntimeError(f"Não é possível iterar 🚶 em algo que não é uma lista 📜.")
 
-        # Gerenciamento de escopo: Salva o valor antigo da variável de iteração (se existir)
-        old_value = self.symbol_table.get(var_name, None)
+        # Gerenciamento de escopo: Salva o valor antigo da variável de iteração
+        # (UNDEFINED se ela não existia)
+        frame = self.frame
+        old_value = frame[slot]
 
+        visit = self.visit
+        body_node = node.body_node
+        result = None
         for item in list_val:
-            self.symbol_table[var_name] = item
-            self.visit(node.body_node)
+            frame[slot] = item
+            if visit(body_node) is _RETURN:
+                result = _RETURN
+                break
 
-        # Restaura o valor antigo (ou remove se não existia)
-        if old_value is not None:
-            self.symbol_table[var_name] = old_value
-        elif var_name in self.symbol_table:
-            # Se não tinha valor antigo, remove a variável do escopo
-            del self.symbol_table[var_name]
+        # Restaura o valor antigo (ou remove, se não existia), inclusive
+        # quando o laço é interrompido por um 🔙
+        frame[slot] = old_value
+        return result
 
     # --- FUNCTION COMMANDS (ATUALIZADO) ---
 
     def visit_FuncDefNode(self, node):
         """ 🧩 (Definir Função) - Armazena a definição da função na memória. """
         func_name = node.func_name
-        if func_name in self.symbol_table:
+        if self.frame[node.slot] is not UNDEFINED:
             raise RuntimeError(f"Função ou variável '{func_name}' já foi definida.")
 
         # A "função" é o próprio nó AST.
-        self.symbol_table[func_name] = node
+        self.frame[node.slot] = node
 
     def visit_FuncCallNode(self, node):  # (NOVO)
         """ 📞 (Chamar Função) - Executa uma função definida. """
         func_name = node.node_to_call.var_name
-        func_def_node = self.symbol_table.get(func_name)
+        func_def_node = self.frame[node.node_to_call.slot]
 
-        if func_def_node is None:
+        if func_def_node is UNDEFINED:
             raise RuntimeError(f"Função '{func_name}' não foi definida 🧩.")
         if not isinstance(func_def_node, FuncDefNode):
             raise RuntimeError(f"'{func_name}' não é uma função 🧩. Não é possível chamar 📞.")
 
         # 1. Checar número de argumentos
-        expected_count = len(func_def_node.arg_name_tokens)
+        expected_count = func_def_node.arg_count
         given_count = len(node.arg_nodes)
         if expected_count != given_count:
             raise RuntimeError(f"Função '{func_name}' espera {expected_count} argumentos, mas recebeu {given_count}.")
 
-        # 2. Avaliar os argumentos (no escopo ATUAL)
-        arg_values = [self.visit(arg_node) for arg_node in node.arg_nodes]
+        # 2. Avaliar os argumentos (no escopo ATUAL). Todos são avaliados
+        #    antes de injetar o primeiro, pois um argumento pode ler uma
+        #    variável com o mesmo nome de um parâmetro.
+        arg_values = [type(arg_node)._visit_fn(self, arg_node) for arg_node in node.arg_nodes]
 
-        # 3. Gerenciamento de escopo: Salvar variáveis
-        arg_names = [token.value for token in func_def_node.arg_name_tokens]
-        saved_vars = {}
-        for name in arg_names:
-            if name in self.symbol_table:
-                saved_vars[name] = self.symbol_table[name]
+        # 3. Gerenciamento de escopo: Salvar cada variável e injetar o
+        #    argumento no seu lugar (uma única passada)
+        frame = self.frame
+        saved_values = []
+        for slot, value in zip(func_def_node.arg_slots, arg_values):
+            saved_values.append(frame[slot])
+            frame[slot] = value
 
-        # 4. Injetar argumentos no escopo
-        for name, value in zip(arg_names, arg_values):
-            self.symbol_table[name] = value
+        body_node = func_def_node.body_node
 
-        # 5. Executar o corpo da função (e capturar o 'return')
+        # 4. Executar o corpo da função (e capturar o 'return')
         return_value = None  # Funções retornam 'None' (nulo) por padrão
-        try:
-            self.visit(func_def_node.body_node)
-        except ReturnSignal as rs:
-            return_value = rs.value
-
-        # 6. Limpar o escopo (restaurar variáveis antigas)
-        for name in arg_names:
-            if name in saved_vars:
-                self.symbol_table[name] = saved_vars[name]
-            else:
-                # Se não existia antes, remova
-                del self.symbol_table[name]
+        if type(body_node)._visit_fn(self, body_node) is _RETURN:
+            return_value = self._return_value
+            self._return_value = None
+
+        # 5. Limpar o escopo (restaurar variáveis antigas, ou UNDEFINED
+        #    se não existiam antes)
+        for slot, value in zip(func_def_node.arg_slots, saved_values):
+            frame[slot] = value
 
         return return_value
 
@@ -368,37 +438,40 @@ class Interpreter:
         if node.node_to_return:
             value_to_return = self.visit(node.node_to_return)
 
-        raise ReturnSignal(value_to_return)
+        self._return_value = value_to_return
+        return _RETURN
 
     # --- LIST COMMANDS ---
 
     def visit_ListAppendNode(self, node):
-        list_name = node.list_var_token.value
-        list_obj = self.symbol_table.get(list_name)
+        list_obj = self.frame[node.slot]
 
-        if list_obj is None:
-            raise RuntimeError(f"Variável de lista '{list_name}' não encontrada.")
-        if not isinstance(list_obj, list):
-            raise RuntimeError(f"'{list_name}' não é uma lista 📜. Não é possível usar ➕📜.")
+        # A single type check on the common path; the error messages are
+        # only worked out when it fails
+        if type(list_obj) is not list:
+            list_name = node.list_var_token.value
+            if list_obj is UNDEFINED:
+                raise RuntimeError(f"Variável de lista '{list_name}' não encontrada.")
+            if not isinstance(list_obj, list):
+                raise RuntimeError(f"'{list_name}' não é uma lista 📜. Não é possível usar ➕📜.")
 
-        value_to_append = self.visit(node.value_node)
-        list_obj.append(value_to_append)
+        value_node = node.value_node
+        list_obj.append(type(value_node)._visit_fn(self, value_node))
 
     def visit_ListRemoveNode(self, node):
-        list_name = node.list_var_token.value
-        list_obj = self.symbol_table.get(list_name)
+        list_obj = self.frame[node.slot]
 
-        if not isinstance(list_obj, list):
-            raise RuntimeError(f"'{list_name}' não é uma lista 📜. Não é possível usar ➖📜.")
+        if type(list_obj) is not list and not isinstance(list_obj, list):
+            raise RuntimeError(f"'{node.list_var_token.value}' não é uma lista 📜. Não é possível usar ➖📜.")
 
         index_to_remove = self.visit(node.index_node)
-        if not isinstance(index_to_remove, int):
+        if type(index_to_remove) is not int and not isinstance(index_to_remove, int):
             raise RuntimeError("Índice para remoção (➖📜) deve ser um inteiro 🔢.")
 
         try:
             list_obj.pop(index_to_remove)
         except IndexError:
-            raise RuntimeError(f"Índice {index_to_remove} fora do alcance para a lista '{list_name}'.")
+            raise RuntimeError(f"Índice {index_to_remove} fora do alcance para a lista '{node.list_var_token.value}'.")
 
     # --- SYSTEM COMMANDS ---
 
@@ -432,6 +505,8 @@ class Interpreter:
 
     def visit_SleepNode(self, node):
         """ ⏱️ <duration> 🔚 """
+        import time  # Only needed by ⏱️, so it is imported on first use
+
         duration = self.visit(node.duration_node)
 
         try:
@@ -444,14 +519,23 @@ class Interpreter:
 
         # Importações locais para evitar dependência circular
         from .lexer import Lexer
-        from .parser import Parser, SyntaxError
+        from .parser import Parser, MojiSyntaxError
 
         module_name = node.module_name_token.value
         filename = f"{module_name}.moji"
 
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                code = f.read()
+            path = os.path.realpath(filename)
+            stat = os.stat(path)
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = _IMPORT_CACHE.get(path)
+            # The cached AST only fits an importer that shares its slot table
+            if (cached is not None and cached[0] == version
+                    and cached[1].slot_table is self.slot_table):
+                code = None  # AST já está no cache
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    code = f.read()
         except FileNotFoundError:
             raise RuntimeError(f"Arquivo de módulo '{filename}' não encontrado para importar ⚙️.")
         except Exception as e:
@@ -459,27 +543,53 @@ class Interpreter:
 
         # Executar o pipeline completo no código importado
         try:
-            lexer = Lexer(code)
-            tokens = lexer.make_tokens()
-            parser = Parser(tokens)
-            ast = parser.parse()
+            if code is None:
+                ast = cached[1]
+            else:
+                lexer = Lexer(code)
+                tokens = lexer.make_tokens()
+                parser = Parser(tokens, self.slot_table)
+                ast = parser.parse()
+                _IMPORT_CACHE[path] = (version, ast)
 
             # Executa o código importado em um *novo* interpretador
             # para que ele tenha seu próprio escopo
             import_interpreter = Interpreter()
             import_interpreter.run(ast)
 
-            # Mescla os símbolos (funções, variáveis) do módulo no escopo atual
-            for key, value in import_interpreter.symbol_table.items():
-                if key in self.symbol_table:
+            # Mescla os símbolos (funções, variáveis) do módulo no escopo atual.
+            # O módulo pode ter criado slots novos, então o frame cresce antes.
+            self.grow_frame()
+            for slot, value in enumerate(import_interpreter.frame):
+                if value is UNDEFINED:
+                    continue
+                if self.frame[slot] is not UNDEFINED:
                     # Evita sobrescrever variáveis existentes
-                    raise RuntimeError(f"Importação ⚙️ de '{filename}' falhou: '{key}' já existe no escopo atual.")
-                self.symbol_table[key] = value
+                    raise RuntimeError(f"Importação ⚙️ de '{filename}' falhou: '{self.slot_table.names[slot]}' já existe no escopo atual.")
+                self.frame[slot] = value
 
-        except (SyntaxError, RuntimeError) as e:
+        except (MojiSyntaxError, RuntimeError) as e:
             raise RuntimeError(f"Erro ao importar ⚙️ o módulo '{filename}':\n{e}")
 
 
+def _install_visitors(interpreter_class):
+    """
+    Caches the (unbound) 'visit_NODE' function on every node class, so a
+    visit is a single class attribute read instead of formatting the
+    method name and calling getattr for every node walked. Node classes
+    without a visitor get the fallback, which keeps the cache free of
+    empty entries. Runs once, when this module is imported, so every
+    Interpreter shares these visitors (subclasses can't replace them).
+    """
+    for node_class in vars(ast_nodes).values():
+        if isinstance(node_class, type) and issubclass(node_class, Node):
+            node_class._visit_fn = getattr(interpreter_class, f'visit_{node_class.__name__}',
+                                           interpreter_class.no_visit_method)
+
+
+_install_visitors(Interpreter)
+
+
 ################################################################################
 # 3. Test Block
 ################################################################################
@@ -487,7 +597,7 @@ class Interpreter:
 if __name__ == '__main__':
     # Import necessary classes for testing
     from .lexer import Lexer
-    from .parser import Parser, SyntaxError
+    from .parser import Parser, MojiSyntaxError
 
     test_code = """
     🌱 💭 This is a complete test program!
@@ -526,7 +636,7 @@ if __name__ == '__main__':
         interpreter = Interpreter()
         interpreter.run(ast)
 
-    except SyntaxError as e:
+    except MojiSyntaxError as e:
         print(f"\n!!! SYNTAX ERROR: {e}")
     except RuntimeError as e:
         print(f"\n!!! RUNTIME ERROR: {e}")
@@ -1,5 +1,8 @@
 # moji/lexer.py
 
+import re
+import sys
+
 # Import Token definitions and the Emoji map from token.py
 from .token import (
     Token, EMOJI_KEYWORDS,
@@ -9,154 +12,113 @@ from .token import (
 
 
 ################################################################################
-# 1. LEXER CLASS
+# 1. TOKEN PATTERN
+# One regular expression that recognizes every kind of token. Scanning the
+# text with it runs inside the 're' module (in C), instead of a Python loop
+# that advances one character at a time.
+################################################################################
+
+# Emoji variation selector (VS16). Editors and keyboards add it to some
+# emojis ('🖨️' is '🖨' + VS16) and leave it out of others, so the keywords are
+# recognized with or without it.
+VARIATION_SELECTOR = '\ufe0f'
+
+# Emoji keyword without variation selectors -> (token type, the keyword as
+# written in EMOJI_KEYWORDS, which becomes the token value)
+EMOJI_LOOKUP = {
+    emoji.replace(VARIATION_SELECTOR, ''): (token_type, emoji)
+    for emoji, token_type in EMOJI_KEYWORDS.items()
+}
+
+
+def _emoji_pattern():
+    """ Regex that matches any emoji keyword (without variation selectors). """
+    # A 2-character emoji (e.g., '➕📜') must win over its 1-character
+    # prefix ('➕'), so those are tried first; the 1-character ones fit in
+    # a single character class, which is checked in one step
+    two_char = [re.escape(emoji) for emoji in EMOJI_LOOKUP if len(emoji) == 2]
+    one_char = [re.escape(emoji) for emoji in EMOJI_LOOKUP if len(emoji) == 1]
+    return '|'.join(two_char) + '|[' + ''.join(one_char) + ']'
+
+
+# Each match is one token, together with the whitespace before it (fewer
+# matches means less work per token)
+TOKEN_PATTERN = re.compile(r"""
+    [ \t\n\r]*                     # Whitespace before the token
+    (?:
+        (?P<comment>💭[^\n]*)        # Comments (until the end of the line)
+      | (?P<emoji>""" + _emoji_pattern() + r""")\ufe0f?  # Keywords (the VS16 after them is optional)
+      | (?P<number>\d+(?:\.\d*)?)    # Integers and reals (a single decimal point)
+      | (?P<identifier>[^\W\d]\w*)   # Names: letters, numbers (but not at the start), and underscore
+      | (?P<string>"[^"]*")          # Strings (between quotes)
+      | (?P<unterminated>")          # A quote that is never closed
+      | (?P<illegal>.)               # Anything else is an error
+      | \Z                           # Only whitespace left until the end
+    )
+""", re.VERBOSE | re.DOTALL)
+
+
+################################################################################
+# 2. LEXER CLASS
 # Responsible for taking the source text and breaking it into a list of Tokens.
 ################################################################################
 
 class Lexer:
     def __init__(self, text):
         self.text = text
-        self.pos = 0  # Current position in the text
-        self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
+        self.pos = 0  # Position of the token being processed (for errors)
 
     def error(self, message):
         """ Raises an exception in case of a lexical error. """
         raise Exception(f"Lexical Error: {message}")
 
-    def advance(self):
-        """ Moves the `pos` pointer to the next character in the text. """
-        self.pos += 1
-        if self.pos < len(self.text):
-            self.current_char = self.text[self.pos]
-        else:
-            self.current_char = None  # Indicates End Of File (EOF)
-
-    def peek(self, n=1):
-        """
-        Looks 'n' characters ahead (lookahead) without consuming the character.
-        Returns None if out of bounds.
-        """
-        peek_pos = self.pos + n
-        if peek_pos < len(self.text):
-            return self.text[peek_pos]
-        return None
-
-    def skip_whitespace(self):
-        """ Skips whitespace characters (space, tab, newline). """
-        while self.current_char is not None and self.current_char in ' \t\n\r':
-            self.advance()
-
-    def skip_comment(self):
-        """ Skips an entire line of commentary (everything after '💭'). """
-        # Advances past the '💭' emoji
-        self.advance()
-        # Continues advancing until a newline or EOF is found
-        while self.current_char is not None and self.current_char != '\n':
-            self.advance()
-
-    def make_number(self):
-        """ Processes a number (integer or real). """
-        num_str = ''
-        dot_count = 0
-
-        while self.current_char is not None and (self.current_char.isdigit() or self.current_char == '.'):
-            if self.current_char == '.':
-                if dot_count == 1:
-                    break  # Second decimal point, stop the loop
-                dot_count += 1
-            num_str += self.current_char
-            self.advance()
-
-        if dot_count == 0:
-            return Token(TT_LIT_INT, int(num_str))
-        else:
-            return Token(TT_LIT_REAL, float(num_str))
-
-    def make_string(self):
-        """ Processes a string literal (between quotes). """
-        str_val = ''
-        self.advance()  # Skip the initial '"'
-
-        while self.current_char is not None and self.current_char != '"':
-            str_val += self.current_char
-            self.advance()
-
-        if self.current_char is None:
-            self.error("Unterminated string.")
-
-        self.advance()  # Skip the final '"'
-        return Token(TT_LIT_STRING, str_val)
-
-    def make_identifier(self):
-        """ Processes an identifier (variable/function name). """
-        ident_str = ''
-        # Names can contain letters, numbers (but not at the start), and underscore
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            ident_str += self.current_char
-            self.advance()
-
-        # Since our keywords are emojis, we don't need to check if an
-        # identifier is a reserved keyword.
-        return Token(TT_IDENTIFIER, ident_str)
-
     def make_tokens(self):
         """
         The main method. Generates a list of all tokens from the source text.
         """
         tokens = []
+        append = tokens.append
+        # Names repeat all over the code: interning keeps a single string
+        # object for each of them (emoji values already come from EMOJI_LOOKUP)
+        intern = sys.intern
 
-        while self.current_char is not None:
+        for match in TOKEN_PATTERN.finditer(self.text):
+            kind = match.lastgroup
 
-            # 1. Skip Whitespace
-            if self.current_char in ' \t\n\r':
-                self.advance()
-                continue
-
-            # 2. Skip Comments
-            if self.current_char == '💭':
-                self.skip_comment()
-                continue
-
-            # 3. Numbers (Integers and Reals)
-            if self.current_char.isdigit():
-                tokens.append(self.make_number())
-                continue
-
-            # 4. Strings
-            if self.current_char == '"':
-                tokens.append(self.make_string())
-                continue
-
-            # 5. Identifiers (Variable names)
-            if self.current_char.isalpha() or self.current_char == '_':
-                tokens.append(self.make_identifier())
-                continue
+            # Emojis (keywords, operators, delimiters)
+            if kind == 'emoji':
+                token_type, emoji_val = EMOJI_LOOKUP[match.group(kind)]
+                append(Token(token_type, emoji_val))
 
-            # 6. Emojis (with Lookahead)
-
-            # --- Lookahead Logic ---
-            # First, we try to see if it's a 2-character token
-            peeked_char = self.peek()
-            if peeked_char is not None:
-                two_char_emoji = self.current_char + peeked_char
-                if two_char_emoji in EMOJI_KEYWORDS:
-                    token_type = EMOJI_KEYWORDS[two_char_emoji]
-                    tokens.append(Token(token_type, two_char_emoji))
-                    self.advance()  # Advance 1st char
-                    self.advance()  # Advance 2nd char
-                    continue
-
-            # If it's not a 2-character token, try a 1-character one
-            if self.current_char in EMOJI_KEYWORDS:
-                token_type = EMOJI_KEYWORDS[self.current_char]
-                emoji_val = self.current_char
-                tokens.append(Token(token_type, emoji_val))
-                self.advance()
+            # Comments (and the whitespace at the end of the text)
+            elif kind == 'comment' or kind is None:
                 continue
 
-            # 7. Error
-            # If it got this far, we don't recognize the character
-            self.error(f"Illegal character or unknown emoji: '{self.current_char}'")
+            # Identifiers (Variable names)
+            elif kind == 'identifier':
+                # Since our keywords are emojis, we don't need to check if an
+                # identifier is a reserved keyword.
+                append(Token(TT_IDENTIFIER, intern(match.group(kind))))
+
+            # Numbers (Integers and Reals)
+            elif kind == 'number':
+                num_str = match.group(kind)
+                if '.' in num_str:
+                    append(Token(TT_LIT_REAL, float(num_str)))
+                else:
+                    append(Token(TT_LIT_INT, int(num_str)))
+
+            # Strings (without the quotes)
+            elif kind == 'string':
+                append(Token(TT_LIT_STRING, match.group(kind)[1:-1]))
+
+            # Errors
+            else:
+                self.pos = match.start(kind)
+                if kind == 'unterminated':
+                    self.error("Unterminated string.")
+                # We don't recognize the character
+                self.error(f"Illegal character or unknown emoji: '{match.group(kind)}'")
 
         # End of loop, add the End Of File token
         tokens.append(Token(TT_EOF))
@@ -0,0 +1,70 @@
+# moji/operations.py
+"""
+Runtime errors and the binary operations shared by the Interpreter (which
+runs them) and the optimizer (which folds them over constants).
+"""
+
+import operator
+
+from .token import (
+    TT_OP_PLUS, TT_OP_MINUS, TT_OP_MUL, TT_OP_DIV,
+    TT_COMP_EQ, TT_COMP_GT, TT_COMP_LT,
+    TT_LOGIC_AND, TT_LOGIC_OR
+)
+
+
+################################################################################
+# 1. RUNTIME ERROR
+################################################################################
+
+class RuntimeError(Exception):
+    def __init__(self, message):
+        # Errors that happen during the *execution* of Moji code
+        super().__init__(f"Runtime Error: {message}")
+
+
+################################################################################
+# 2. BINARY OPERATIONS
+# Maps each binary operator token type to the function that executes it.
+################################################################################
+
+def _plus(left_val, right_val):
+    # Two values of the same type (the common case in loops) add directly
+    if type(left_val) is type(right_val):
+        return left_val + right_val
+    # If one side is a string, force concatenation
+    if type(left_val) is str or type(right_val) is str:
+        return str(left_val) + str(right_val)
+    return left_val + right_val  # E.g., int + real
+
+
+def _divide(left_val, right_val):
+    if right_val == 0:
+        raise RuntimeError("Divisão por zero.")
+    return left_val / right_val
+
+
+def _logic_and(left_val, right_val):
+    return bool(left_val) and bool(right_val)
+
+
+def _logic_or(left_val, right_val):
+    return bool(left_val) or bool(right_val)
+
+
+BINARY_OPERATIONS = {
+    # Mathematical Operations
+    TT_OP_PLUS: _plus,
+    TT_OP_MINUS: operator.sub,
+    TT_OP_MUL: operator.mul,
+    TT_OP_DIV: _divide,
+
+    # Comparison Operations
+    TT_COMP_EQ: operator.eq,
+    TT_COMP_GT: operator.gt,
+    TT_COMP_LT: operator.lt,
+
+    # (NOVO) Logic Operations
+    TT_LOGIC_AND: _logic_and,
+    TT_LOGIC_OR: _logic_or,
+}
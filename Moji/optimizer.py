@@ -0,0 +1,159 @@
+# moji/optimizer.py
+
+"""
+Transformations applied to the AST before it is executed.
+
+Constant folding: any operation whose operands are all literals
+(e.g., 60 ✖️ 60, "a" ➕ "b", 🚫 0) is computed once here and replaced by a
+single literal node, so loops don't re-evaluate it on every iteration.
+
+String concatenation: a chain of ➕ that is known to produce text (e.g.,
+"Olá, " ➕ nome ➕ "!") becomes a single StringConcatNode, which joins all of
+its parts at once instead of building a temporary string per ➕.
+"""
+
+from .ast_nodes import (Node, NumberNode, StringNode, BinOpNode, UnaryOpNode,
+                        StringConcatNode)
+from .token import (Token, TT_LIT_INT, TT_LIT_REAL, TT_LIT_STRING, TT_LOGIC_NOT,
+                    TT_OP_PLUS, TT_OP_MUL)
+from .operations import BINARY_OPERATIONS
+
+# Longest text a folded ✖️ may produce (e.g., "-" ✖️ 40). Folding happens
+# before the program runs, even in code that is never reached, so a bigger
+# repetition is left for runtime.
+MAX_FOLDED_LENGTH = 4096
+
+
+################################################################################
+# 1. CONSTANT FOLDING
+################################################################################
+
+def fold_constants(node):
+    """
+    Folds constant sub-expressions of 'node' (in place, children first)
+    and returns the node that should take its place.
+    """
+    if type(node) is BinOpNode:
+        return _fold_chain(node)
+
+    # Fold the children first, so whole literal sub-trees collapse bottom-up
+    for field in type(node).__slots__:
+        value = getattr(node, field)
+        if isinstance(value, Node):
+            setattr(node, field, fold_constants(value))
+        elif isinstance(value, list):
+            # Statement lists, call arguments and the conditions/bodies
+            # of IfNode
+            value[:] = [_fold_item(item) for item in value]
+
+    if isinstance(node, UnaryOpNode):
+        if node.op_token.type == TT_LOGIC_NOT and _is_literal(node.node):
+            return _literal(not bool(node.node.value))
+
+    return node
+
+
+def _fold_chain(node):
+    """
+    Folds a BinOpNode. Left-deep chains (a ➕ b ➕ c ...) are walked down
+    in a loop and folded from the innermost operation up, so a long
+    expression doesn't recurse once per operator.
+    """
+    chain = []
+    while type(node) is BinOpNode:
+        chain.append(node)
+        node = node.left_node
+
+    left_node = fold_constants(node)
+    for node in reversed(chain):
+        node.left_node = left_node
+        right_node = node.right_node = fold_constants(node.right_node)
+
+        if _is_literal(left_node) and _is_literal(right_node):
+            op_func = BINARY_OPERATIONS.get(node.op_token.type)
+            if op_func is not None:
+                left_node = _fold(node, op_func, left_node.value, right_node.value)
+                continue
+        if node.op_token.type == TT_OP_PLUS:
+            left_node = _concat(node)
+        else:
+            left_node = node
+    return left_node
+
+
+def _fold_item(item):
+    if isinstance(item, Node):
+        return fold_constants(item)
+    return item  # Tokens (e.g., FuncDefNode.arg_name_tokens)
+
+
+def _concat(node):
+    """
+    Rewrites 'left ➕ right' as a StringConcatNode when its result is
+    surely text, i.e., when one side is a string literal or is itself a
+    concatenation. Since the tree is folded bottom-up, a left-associative
+    chain grows into a single node, one part at a time.
+    """
+    left_node, right_node = node.left_node, node.right_node
+    if not (type(left_node) is StringNode or type(right_node) is StringNode
+            or type(left_node) is StringConcatNode
+            or type(right_node) is StringConcatNode):
+        return node  # May be a numeric addition
+
+    if type(left_node) is StringConcatNode:
+        # Grow the concatenation built for the inner ➕ of the chain
+        concat_node = left_node
+    else:
+        concat_node = StringConcatNode([])
+        _add_part(concat_node.parts, left_node)
+
+    if type(right_node) is StringConcatNode:
+        for part in right_node.parts:
+            _add_part(concat_node.parts, part)
+    else:
+        _add_part(concat_node.parts, right_node)
+    return concat_node
+
+
+def _add_part(parts, part):
+    """ Appends 'part', merging it with the previous one if both are literals. """
+    if _is_literal(part):
+        if parts and _is_literal(parts[-1]):
+            part = _literal(str(parts[-1].value) + str(part.value))
+            parts.pop()
+        else:
+            part = _literal(str(part.value))
+    parts.append(part)
+
+
+def _is_literal(node):
+    return type(node) is NumberNode or type(node) is StringNode
+
+
+def _fold(node, op_func, left_val, right_val):
+    """ Computes a literal operation, keeping the node if it fails. """
+    if node.op_token.type == TT_OP_MUL and _repeats_too_much(left_val, right_val):
+        return node
+    try:
+        return _literal(op_func(left_val, right_val))
+    except Exception:
+        # E.g., 1 ➗ 0 or "a" ⬇️ 1: leave it so the error (if that code
+        # is ever reached) is raised at runtime, as usual
+        return node
+
+
+def _repeats_too_much(left_val, right_val):
+    """ True if 'left ✖️ right' repeats a text past MAX_FOLDED_LENGTH. """
+    if isinstance(right_val, str):
+        left_val, right_val = right_val, left_val
+    return (isinstance(left_val, str) and isinstance(right_val, int)
+            and len(left_val) * right_val > MAX_FOLDED_LENGTH)
+
+
+def _literal(value):
+    """ Builds the literal node that holds a pre-computed value. """
+    if isinstance(value, str):
+        return StringNode(Token(TT_LIT_STRING, value))
+    if isinstance(value, float):
+        return NumberNode(Token(TT_LIT_REAL, value))
+    return NumberNode(Token(TT_LIT_INT, value))  # int or bool
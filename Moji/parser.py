@@ -8,10 +8,11 @@ from .ast_nodes import (
     ListRemoveNode, ImportNode, SaveNode, SleepNode,
     # (NOVOS NÓS IMPORTADOS)
     WhileNode, ForNode, ListAccessNode, FileReadNode, TypeCastNode,
-    FuncCallNode, FileAppendNode
+    FuncCallNode, FileAppendNode, SlotTable
 )
 # Imports all token types that the Parser needs to recognize
 from .token import (
+    Token,
     TT_PROGRAM_START, TT_PROGRAM_END, TT_BLOCK_START, TT_BLOCK_END,
     TT_KEYWORD_INT, TT_KEYWORD_REAL, TT_KEYWORD_STRING, TT_KEYWORD_LIST,
     TT_KEYWORD_READ, TT_KEYWORD_PRINT, TT_OP_PLUS, TT_OP_MINUS,
@@ -22,7 +23,8 @@ from .token import (
     TT_IDENTIFIER, TT_LIT_INT, TT_LIT_REAL, TT_LIT_STRING, TT_EOF,
     # (NOVOS TOKENS IMPORTADOS)
     TT_KEYWORD_CALL, TT_KEYWORD_WHILE, TT_KEYWORD_FOR, TT_LOGIC_AND,
-    TT_LOGIC_OR, TT_KEYWORD_GET_AT, TT_KEYWORD_READ_FILE, TT_KEYWORD_APPEND_FILE
+    TT_LOGIC_OR, TT_KEYWORD_GET_AT, TT_KEYWORD_READ_FILE, TT_KEYWORD_APPEND_FILE,
+    TT_NAMES
 )
 
 
@@ -30,49 +32,78 @@ from .token import (
 # 1. SYNTAX ERROR
 ################################################################################
 
-class SyntaxError(Exception):
-    def __init__(self, message):
-        super().__init__(f"Syntax Error: {message}")
+class MojiSyntaxError(Exception):
+    """
+    Raised by the Parser (named so it doesn't shadow Python's SyntaxError).
+    The message is only formatted when the error is shown (str()): it may
+    have '{}' fields, filled in with the extra arguments.
+    """
+    def __str__(self):
+        message, *format_args = self.args
+        if format_args:
+            message = message.format(*format_args)
+        return f"Syntax Error: {message}"
 
 
 ################################################################################
 # 2. PARSER CLASS
 ################################################################################
 
+# Precedence of each binary operator (higher binds tighter; see binary_operation)
+BINARY_PRECEDENCE = {
+    TT_LOGIC_OR: 1,                                 # 🌀
+    TT_LOGIC_AND: 2,                                # 🤝
+    TT_COMP_EQ: 3, TT_COMP_GT: 3, TT_COMP_LT: 3,    # ⚖️, ⬆️, ⬇️
+    TT_OP_PLUS: 4, TT_OP_MINUS: 4,                  # ➕, ➖
+    TT_OP_MUL: 5, TT_OP_DIV: 5,                     # ✖️, ➗
+}
+
+# Type keywords that also work as a conversion in an expression (🔢 "123")
+CAST_TYPES = frozenset((TT_KEYWORD_INT, TT_KEYWORD_REAL, TT_KEYWORD_STRING))
+
+# This set helps us guess if the next token is the START of an argument
+# (see the 📞 case in atom)
+ATOM_START_TOKENS = frozenset((
+    TT_LIT_INT, TT_LIT_REAL, TT_LIT_STRING,
+    TT_IDENTIFIER, TT_KEYWORD_CALL, TT_KEYWORD_READ_FILE,
+    TT_KEYWORD_INT, TT_KEYWORD_REAL, TT_KEYWORD_STRING,
+    TT_LOGIC_NOT  # Unary operator
+))
+
+
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, slot_table=None):
+        # The slots of the names in this program (see ast_nodes.SlotTable).
+        # ⚙️ (Importar) passes the importer's table, so both share slots
+        self.slot_table = slot_table if slot_table is not None else SlotTable()
+
+        if not tokens or tokens[-1].type != TT_EOF:
+            # The Lexer always ends the list with EOF. The parser relies on it
+            # as a sentinel: no rule consumes EOF and every loop stops at it,
+            # so advance() never has to check the list bounds
+            tokens = list(tokens) + [Token(TT_EOF)]
         self.tokens = tokens
+        # The type of each token, in a parallel list: the parser checks types
+        # far more often than it reads a whole token (only to build a node),
+        # so it indexes this list instead of doing 'token.type' every time
+        self.types = [token.type for token in tokens]
         self.token_idx = 0
-        # Initializes the current token with the first token in the list
-        self.current_token = self.tokens[self.token_idx] if self.tokens else None
 
     def advance(self):
         """ Advances to the next token in the list. """
         self.token_idx += 1
-        if self.token_idx < len(self.tokens):
-            self.current_token = self.tokens[self.token_idx]
-        else:
-            # If no more tokens, current token remains the last one (usually EOF)
-            self.current_token = self.tokens[-1]
-        return self.current_token
-
-    def peek(self, n=1):
-        """ Peeks at the token 'n' positions ahead without advancing. """
-        peek_idx = self.token_idx + n
-        if peek_idx < len(self.tokens):
-            return self.tokens[peek_idx]
-        return None
 
     def eat(self, expected_token_type):
         """
         Consumes the current token if it is of the expected type.
         If not, raises a syntax error.
         """
-        if self.current_token.type == expected_token_type:
-            self.advance()
+        if self.types[self.token_idx] == expected_token_type:
+            self.token_idx += 1
         else:
-            raise SyntaxError(
-                f"Expected '{expected_token_type}', but found '{self.current_token.type}'"
+            raise MojiSyntaxError(
+                "Expected '{}', but found '{}'",
+                TT_NAMES[expected_token_type], TT_NAMES[self.types[self.token_idx]]
             )
 
     # --- STARTING POINT (Top Level) ---
@@ -91,10 +122,10 @@ class Parser:
         self.eat(TT_PROGRAM_END)
 
         # If it got here and the next token is not EOF, there's leftover code
-        if self.current_token.type != TT_EOF:
-            raise SyntaxError("Code found after program end '🌳'.")
+        if self.types[self.token_idx] != TT_EOF:
+            raise MojiSyntaxError("Code found after program end '🌳'.")
 
-        return ProgramNode(statements)
+        return ProgramNode(statements, self.slot_table)
 
     # --- STATEMENTS ---
 
@@ -105,64 +136,26 @@ class Parser:
         """
         statement_list = []
 
-        while self.current_token.type != end_token_type and self.current_token.type != TT_EOF:
+        while self.types[self.token_idx] != end_token_type and self.types[self.token_idx] != TT_EOF:
             statement_list.append(self.statement())
 
         return statement_list
 
     def statement(self):
         """ Router: Decides which type of statement is being read. """
-        token_type = self.current_token.type
-
-        # 🖨️ ... 🔚 (Print)
-        if token_type == TT_KEYWORD_PRINT:
-            return self.print_statement()
-
-        # 👀 ... 🔚 (Read)
-        if token_type == TT_KEYWORD_READ:
-            return self.read_statement()
-
-        # 🔢, 💬, 👽, 📜 ... (Var Declaration)
-        if token_type in (TT_KEYWORD_INT, TT_KEYWORD_REAL, TT_KEYWORD_STRING, TT_KEYWORD_LIST):
-            return self.var_declaration()
-
-        # 🤔 ... (If)
-        if token_type == TT_KEYWORD_IF:
-            return self.if_statement()
-
-        # ⏳ ... (While Loop) (NOVO)
-        if token_type == TT_KEYWORD_WHILE:
-            return self.while_statement()
-
-        # 🚶 ... (For Loop) (NOVO)
-        if token_type == TT_KEYWORD_FOR:
-            return self.for_statement()
-
-        # 📦 ... 📦⛔ (Block)
-        if token_type == TT_BLOCK_START:
-            return self.block()
-
-        # 🧩 ... (Function Definition)
-        if token_type == TT_KEYWORD_FUN:
-            return self.func_definition()
-
-        # 🔙 ... (Return)
-        if token_type == TT_KEYWORD_RETURN:
-            return self.return_statement()
-
-        # ⚙️, 💾, ⏱️ (System Commands)
-        if token_type == TT_KEYWORD_IMPORT:
-            return self.import_statement()
-        if token_type == TT_KEYWORD_SAVE:
-            return self.save_statement()
-        if token_type == TT_KEYWORD_APPEND_FILE:  # (NOVO)
-            return self.file_append_statement()
-        if token_type == TT_KEYWORD_SLEEP:
-            return self.sleep_statement()
+        token_type = self.types[self.token_idx]
+
+        # Statements that start with a keyword (🖨️, 🤔, 🧩, ...): one lookup
+        # in STATEMENT_PARSERS (see the end of this section)
+        parse_fn = self.STATEMENT_PARSERS.get(token_type)
+        if parse_fn is not None:
+            return parse_fn(self)
 
         # Identifier (Could be Assignment or List Op)
         if token_type == TT_IDENTIFIER:
-            next_token_type = self.peek().type
+            # An identifier is never the last token (EOF is), so the next
+            # one always exists
+            next_token_type = self.types[self.token_idx + 1]
 
             # x 👉 ... 🔚 (Assignment)
             if next_token_type == TT_ASSIGN:
@@ -177,7 +170,7 @@ class Parser:
                 return self.list_remove()
 
         # If it's none of the above, it's an error.
-        raise SyntaxError(f"Unexpected statement: token '{self.current_token}'")
+        raise MojiSyntaxError("Unexpected statement: token '{}'", self.tokens[self.token_idx])
 
     def print_statement(self):
         """ Parses: 🖨️ <expression> 🔚 """
@@ -189,79 +182,82 @@ class Parser:
     def read_statement(self):
         """ Parses: 👀 <identifier> 🔚 """
         self.eat(TT_KEYWORD_READ)
-        var_token = self.current_token
+        var_token = self.tokens[self.token_idx]
         self.eat(TT_IDENTIFIER)
         self.eat(TT_END_STATEMENT)
-        return ReadNode(var_token)
+        return ReadNode(var_token, self.slot_table)
 
     def var_declaration(self):
         """ Parses: <type> <name> [👉 <expression>] 🔚 """
-        type_token = self.current_token
+        type_token = self.tokens[self.token_idx]
         self.advance()  # Consume the type (🔢, 💬, etc.)
 
-        var_name_token = self.current_token
+        var_name_token = self.tokens[self.token_idx]
         self.eat(TT_IDENTIFIER)
 
         value_node = None
         # Check if it's a declaration with initialization
-        if self.current_token.type == TT_ASSIGN:
+        if self.types[self.token_idx] == TT_ASSIGN:
             self.eat(TT_ASSIGN)
             value_node = self.expression()
 
         self.eat(TT_END_STATEMENT)
-        return VarDeclareNode(type_token, var_name_token, value_node)
+        return VarDeclareNode(type_token, var_name_token, value_node, self.slot_table)
 
     def var_assignment(self):
         """ Parses: <name> 👉 <expression> 🔚 """
-        var_name_token = self.current_token
+        var_name_token = self.tokens[self.token_idx]
         self.eat(TT_IDENTIFIER)
         self.eat(TT_ASSIGN)
         value_node = self.expression()
         self.eat(TT_END_STATEMENT)
-        return VarAssignNode(var_name_token, value_node)
+        return VarAssignNode(var_name_token, value_node, self.slot_table)
 
     def list_append(self):
         """ Parses: <list_name> ➕📜 <expression> 🔚 """
-        list_var_token = self.current_token
+        list_var_token = self.tokens[self.token_idx]
         self.eat(TT_IDENTIFIER)
         self.eat(TT_KEYWORD_APPEND)
         value_node = self.expression()
         self.eat(TT_END_STATEMENT)
-        return ListAppendNode(list_var_token, value_node)
+        return ListAppendNode(list_var_token, value_node, self.slot_table)
 
     def list_remove(self):
         """ Parses: <list_name> ➖📜 <index_expression> 🔚 """
-        list_var_token = self.current_token
+        list_var_token = self.tokens[self.token_idx]
         self.eat(TT_IDENTIFIER)
         self.eat(TT_KEYWORD_REMOVE)
         index_node = self.expression()  # The index to be removed
         self.eat(TT_END_STATEMENT)
-        return ListRemoveNode(list_var_token, index_node)
+        return ListRemoveNode(list_var_token, index_node, self.slot_table)
 
     def if_statement(self):
         """ Parses: 🤔 <cond> 📦 ... 📦⛔ [🔀 <cond> 📦 ... 📦⛔]* [🤨 📦 ... 📦⛔] """
-        cases = []
+        conditions = []
+        bodies = []
         else_case = None
 
         # IF block (mandatory)
         self.eat(TT_KEYWORD_IF)
         condition = self.expression()
         body = self.block()
-        cases.append((condition, body))
+        conditions.append(condition)
+        bodies.append(body)
 
         # ELIF blocks (optional)
-        while self.current_token.type == TT_KEYWORD_ELIF:
+        while self.types[self.token_idx] == TT_KEYWORD_ELIF:
             self.eat(TT_KEYWORD_ELIF)
             condition = self.expression()
             body = self.block()
-            cases.append((condition, body))
+            conditions.append(condition)
+            bodies.append(body)
 
         # ELSE block (optional)
-        if self.current_token.type == TT_KEYWORD_ELSE:
+        if self.types[self.token_idx] == TT_KEYWORD_ELSE:
             self.eat(TT_KEYWORD_ELSE)
             else_case = self.block()
 
-        return IfNode(cases, else_case)
+        return IfNode(conditions, bodies, else_case)
 
     def while_statement(self):  # (NOVO)
         """ Parses: ⏳ <condition> 📦 ... 📦⛔ """
@@ -273,11 +269,11 @@ class Parser:
     def for_statement(self):  # (NOVO)
         """ Parses: 🚶 <var_name> <list_expression> 📦 ... 📦⛔ """
         self.eat(TT_KEYWORD_FOR)
-        var_name_token = self.current_token
+        var_name_token = self.tokens[self.token_idx]
         self.eat(TT_IDENTIFIER)
         list_node = self.expression()
         body_node = self.block()
-        return ForNode(var_name_token, list_node, body_node)
+        return ForNode(var_name_token, list_node, body_node, self.slot_table)
 
     def block(self):
         """ Parses: 📦 <list_of_statements> 📦⛔ """
@@ -291,17 +287,17 @@ class Parser:
         """ Parses: 🧩 <name> [arg1] [arg2] ... 📦 ... 📦⛔ """
         self.eat(TT_KEYWORD_FUN)
 
-        func_name_token = self.current_token
+        func_name_token = self.tokens[self.token_idx]
         self.eat(TT_IDENTIFIER)
 
         arg_name_tokens = []
         # Keep reading argument names until 📦 is found
-        while self.current_token.type == TT_IDENTIFIER:
-            arg_name_tokens.append(self.current_token)
+        while self.types[self.token_idx] == TT_IDENTIFIER:
+            arg_name_tokens.append(self.tokens[self.token_idx])
             self.eat(TT_IDENTIFIER)
 
         body_node = self.block()
-        return FuncDefNode(func_name_token, arg_name_tokens, body_node)
+        return FuncDefNode(func_name_token, arg_name_tokens, body_node, self.slot_table)
 
     def return_statement(self):
         """ Parses: 🔙 [<expression>] 🔚 """
@@ -309,7 +305,7 @@ class Parser:
 
         node_to_return = None
         # If there is something to return (not just "🔙 🔚")
-        if self.current_token.type != TT_END_STATEMENT:
+        if self.types[self.token_idx] != TT_END_STATEMENT:
             node_to_return = self.expression()
 
         self.eat(TT_END_STATEMENT)
@@ -318,7 +314,7 @@ class Parser:
     # System commands
     def import_statement(self):
         self.eat(TT_KEYWORD_IMPORT)
-        module_name_token = self.current_token
+        module_name_token = self.tokens[self.token_idx]
         self.eat(TT_IDENTIFIER)  # Assuming we import by name
         self.eat(TT_END_STATEMENT)
         return ImportNode(module_name_token)
@@ -344,53 +340,56 @@ class Parser:
         self.eat(TT_END_STATEMENT)
         return SleepNode(duration_node)
 
-    # --- EXPRESSIONS (Operator Precedence) ---
-
-    def binary_operation(self, func_to_call, valid_op_types):
-        """
-        Generic helper function to process binary operations
-        (like 1 ➕ 2, or 10 ⚖️ x)
-        """
-        left = func_to_call()
+    # Statement keyword -> method that parses it (used by statement())
+    STATEMENT_PARSERS = {
+        TT_KEYWORD_PRINT: print_statement,         # 🖨️ ... 🔚
+        TT_KEYWORD_READ: read_statement,           # 👀 ... 🔚
+        TT_KEYWORD_INT: var_declaration,           # 🔢, 👽, 💬, 📜 ...
+        TT_KEYWORD_REAL: var_declaration,
+        TT_KEYWORD_STRING: var_declaration,
+        TT_KEYWORD_LIST: var_declaration,
+        TT_KEYWORD_IF: if_statement,               # 🤔 ...
+        TT_KEYWORD_WHILE: while_statement,         # ⏳ ... (NOVO)
+        TT_KEYWORD_FOR: for_statement,             # 🚶 ... (NOVO)
+        TT_BLOCK_START: block,                     # 📦 ... 📦⛔
+        TT_KEYWORD_FUN: func_definition,           # 🧩 ...
+        TT_KEYWORD_RETURN: return_statement,       # 🔙 ...
+        TT_KEYWORD_IMPORT: import_statement,       # ⚙️ ...
+        TT_KEYWORD_SAVE: save_statement,           # 💾 ...
+        TT_KEYWORD_APPEND_FILE: file_append_statement,  # ✍️ ... (NOVO)
+        TT_KEYWORD_SLEEP: sleep_statement,         # ⏱️ ...
+    }
 
-        while self.current_token.type in valid_op_types:
-            op_token = self.current_token
-            self.eat(op_token.type)
-            right = func_to_call()
-            left = BinOpNode(left, op_token, right)
-
-        return left
+    # --- EXPRESSIONS (Operator Precedence) ---
 
     def expression(self):  # (ATUALIZADO)
         """ Entry point for any expression. (Lowest precedence: 🌀) """
-        return self.logic_or()
-
-    def logic_or(self):  # (NOVO)
-        """ Parses: 🌀 (Logical OR) """
-        return self.binary_operation(self.logic_and, (TT_LOGIC_OR,))
-
-    def logic_and(self):  # (NOVO)
-        """ Parses: 🤝 (Logical AND) """
-        return self.binary_operation(self.comparison, (TT_LOGIC_AND,))
-
-    def comparison(self):
-        """ Parses: ⚖️, ⬆️, ⬇️ """
-        # (ATUALIZADO: agora chama self.term)
-        return self.binary_operation(self.term, (TT_COMP_EQ, TT_COMP_GT, TT_COMP_LT))
-
-    def term(self):
-        """ Parses: ➕, ➖ """
-        return self.binary_operation(self.factor, (TT_OP_PLUS, TT_OP_MINUS))
+        return self.binary_operation(1)
 
-    def factor(self):
-        """ Parses: ✖️, ➗ """
-        # (ATUALIZADO: agora chama self.unary)
-        return self.binary_operation(self.unary, (TT_OP_MUL, TT_OP_DIV))
+    def binary_operation(self, min_precedence):
+        """
+        Parses the binary operations (like 1 ➕ 2, or 10 ⚖️ x) whose operators
+        have at least 'min_precedence' (see BINARY_PRECEDENCE), by precedence
+        climbing: the right operand of each operator is parsed one level above
+        it, so every level is left-associative. Builds the same tree as one
+        method per level (🌀 -> 🤝 -> comparison -> term -> factor) without
+        going through all of them for every operand.
+        """
+        left = self.unary()
+
+        while True:
+            precedence = BINARY_PRECEDENCE.get(self.types[self.token_idx])
+            if precedence is None or precedence < min_precedence:
+                return left
+            op_token = self.tokens[self.token_idx]
+            self.token_idx += 1
+            right = self.binary_operation(precedence + 1)
+            left = BinOpNode(left, op_token, right)
 
     def unary(self):
         """ Parses: 🚫 """
-        if self.current_token.type == TT_LOGIC_NOT:
-            op_token = self.current_token
+        if self.types[self.token_idx] == TT_LOGIC_NOT:
+            op_token = self.tokens[self.token_idx]
             self.eat(TT_LOGIC_NOT)
             node = self.unary()  # Recursive call to allow '🚫🚫x'
             return UnaryOpNode(op_token, node)
@@ -402,7 +401,7 @@ class Parser:
         node = self.atom()  # Get the base atom (e.g., myList)
 
         # Allow chaining: myList 🎯 0 🎯 1
-        while self.current_token.type == TT_KEYWORD_GET_AT:
+        while self.types[self.token_idx] == TT_KEYWORD_GET_AT:
             self.eat(TT_KEYWORD_GET_AT)
             index_node = self.expression()  # The index can be a full expression
             node = ListAccessNode(node, index_node)  # Wrap the previous node
@@ -415,62 +414,55 @@ class Parser:
         function calls, type casts, etc.
         (Highest precedence level).
         """
-        token = self.current_token
+        token = self.tokens[self.token_idx]
+        token_type = self.types[self.token_idx]
 
-        if token.type == TT_LIT_INT or token.type == TT_LIT_REAL:
-            self.eat(token.type)
+        if token_type == TT_LIT_INT or token_type == TT_LIT_REAL:
+            self.token_idx += 1
             return NumberNode(token)
 
-        elif token.type == TT_LIT_STRING:
-            self.eat(TT_LIT_STRING)
+        elif token_type == TT_LIT_STRING:
+            self.token_idx += 1
             return StringNode(token)
 
         # (NOVO) Type Casting: 🔢 "123"
-        elif token.type in (TT_KEYWORD_INT, TT_KEYWORD_REAL, TT_KEYWORD_STRING):
-            type_token = self.current_token
+        elif token_type in CAST_TYPES:
+            type_token = token
             self.advance()
             value_to_cast = self.expression()  # Parse the expression to cast
             return TypeCastNode(type_token, value_to_cast)
 
         # (NOVO) File Read: 📖 "file.txt"
-        elif token.type == TT_KEYWORD_READ_FILE:
+        elif token_type == TT_KEYWORD_READ_FILE:
             self.eat(TT_KEYWORD_READ_FILE)
             filename_node = self.expression()  # Parse the filename expression
             return FileReadNode(filename_node)
 
         # (NOVO) Function Call: 📞 myFunc arg1 (arg2 ➕ 1) ...
-        elif token.type == TT_KEYWORD_CALL:
+        elif token_type == TT_KEYWORD_CALL:
             self.eat(TT_KEYWORD_CALL)
 
-            if self.current_token.type != TT_IDENTIFIER:
-                raise SyntaxError("Expected function name after 📞")
+            if self.types[self.token_idx] != TT_IDENTIFIER:
+                raise MojiSyntaxError("Expected function name after 📞")
 
-            node_to_call = VarAccessNode(self.current_token)
+            node_to_call = VarAccessNode(self.tokens[self.token_idx], self.slot_table)
             self.eat(TT_IDENTIFIER)
 
             arg_nodes = []
 
-            # This set helps us guess if the next token is the START of an argument
-            ATOM_START_TOKENS = (
-                TT_LIT_INT, TT_LIT_REAL, TT_LIT_STRING,
-                TT_IDENTIFIER, TT_KEYWORD_CALL, TT_KEYWORD_READ_FILE,
-                TT_KEYWORD_INT, TT_KEYWORD_REAL, TT_KEYWORD_STRING,
-                TT_LOGIC_NOT  # Unary operator
-            )
-
             # Keep parsing arguments (which are full expressions)
             # as long as the current token looks like the start of one.
-            while self.current_token.type in ATOM_START_TOKENS:
+            while self.types[self.token_idx] in ATOM_START_TOKENS:
                 arg_nodes.append(self.expression())
 
             return FuncCallNode(node_to_call, arg_nodes)
 
-        elif token.type == TT_IDENTIFIER:
-            self.eat(TT_IDENTIFIER)
-            return VarAccessNode(token)  # Accessing a variable
+        elif token_type == TT_IDENTIFIER:
+            self.token_idx += 1
+            return VarAccessNode(token, self.slot_table)  # Accessing a variable
 
         # If it's none of the above, it's a syntax error in the expression
-        raise SyntaxError(f"Expected an expression atom (Number, String, Identifier, 📞, 📖, 🔢...), but found: {token}")
+        raise MojiSyntaxError("Expected an expression atom (Number, String, Identifier, 📞, 📖, 🔢...), but found: {}", token)
 
 
 ################################################################################
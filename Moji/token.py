@@ -10,9 +10,11 @@ class Token:
     A simple object to store the token type and its (optional) value.
 
     Attributes:
-        type (str): The type of the token (e.g., TT_OP_PLUS, TT_LIT_INT).
+        type (int): The type of the token (e.g., TT_OP_PLUS, TT_LIT_INT).
         value (any): The value of the token (e.g., 123, "hello", or the emoji '➕' itself).
     """
+    # One Token per lexeme: slots keep them small (no per-instance __dict__)
+    __slots__ = ('type', 'value')
 
     def __init__(self, type, value=None):
         self.type = type
@@ -23,91 +25,109 @@ class Token:
         A friendly representation for debugging, e.g.: Token(TT_LIT_INT:123)
         """
         if self.value is not None:
-            return f'Token({self.type}:{self.value})'
-        return f'Token({self.type})'
+            return f'Token({TT_NAMES[self.type]}:{self.value})'
+        return f'Token({TT_NAMES[self.type]})'
 
 
 ################################################################################
 # 2. TOKEN TYPE CONSTANTS (TT = Token Type)
+# Token types are small ints, numbered densely from 0 (an int comparison or
+# hash is cheaper than a string one). Compare them with ==
+# (`token.type == TT_OP_PLUS`), never with 'is'.
+# TT_NAMES (below) gives the name of each type, for messages and reprs.
 ################################################################################
 
 # --- Non-Emoji Tokens (Literals, Identifiers) ---
 
 # A variable name (e.g., 'age')
-TT_IDENTIFIER = 'IDENTIFIER'
+TT_IDENTIFIER = 0
 
 # Literals (raw values)
-TT_LIT_INT = 'LIT_INT'      # e.g.: 10, 25
-TT_LIT_REAL = 'LIT_REAL'    # e.g.: 3.14
-TT_LIT_STRING = 'LIT_STRING'  # e.g.: "Hello, world!"
+TT_LIT_INT = 1     # e.g.: 10, 25
+TT_LIT_REAL = 2    # e.g.: 3.14
+TT_LIT_STRING = 3  # e.g.: "Hello, world!"
 
 # End of file
-TT_EOF = 'EOF'  # End Of File
+TT_EOF = 4  # End Of File
 
 # --- Program Structure ---
-TT_PROGRAM_START = 'PROGRAM_START'  # 🌱
-TT_PROGRAM_END = 'PROGRAM_END'      # 🌳
+TT_PROGRAM_START = 5  # 🌱
+TT_PROGRAM_END = 6    # 🌳
 
 # --- Code Blocks ---
-TT_BLOCK_START = 'BLOCK_START'  # 📦
-TT_BLOCK_END = 'BLOCK_END'      # 📦⛔
+TT_BLOCK_START = 7  # 📦
+TT_BLOCK_END = 8    # 📦⛔
 
 # --- Variable Declaration (Keywords) ---
-TT_KEYWORD_INT = 'KEYWORD_INT'      # 🔢
-TT_KEYWORD_REAL = 'KEYWORD_REAL'    # 👽
-TT_KEYWORD_STRING = 'KEYWORD_STRING'  # 💬
+TT_KEYWORD_INT = 9      # 🔢
+TT_KEYWORD_REAL = 10    # 👽
+TT_KEYWORD_STRING = 11  # 💬
 
 # --- Input / Output (Keywords) ---
-TT_KEYWORD_READ = 'KEYWORD_READ'    # 👀
-TT_KEYWORD_PRINT = 'KEYWORD_PRINT'  # 🖨️
+TT_KEYWORD_READ = 12   # 👀
+TT_KEYWORD_PRINT = 13  # 🖨️
 
 # --- Mathematical Operations ---
-TT_OP_PLUS = 'OP_PLUS'    # ➕
-TT_OP_MINUS = 'OP_MINUS'  # ➖
-TT_OP_MUL = 'OP_MUL'      # ✖️
-TT_OP_DIV = 'OP_DIV'      # ➗
+TT_OP_PLUS = 14   # ➕
+TT_OP_MINUS = 15  # ➖
+TT_OP_MUL = 16    # ✖️
+TT_OP_DIV = 17    # ➗
 
 # --- Assignment ---
-TT_ASSIGN = 'ASSIGN'  # 👉
+TT_ASSIGN = 18  # 👉
 
 # --- Syntax ---
-TT_COMMENT = 'COMMENT'          # 💭
-TT_END_STATEMENT = 'END_STATEMENT'  # 🔚
+TT_COMMENT = 19        # 💭
+TT_END_STATEMENT = 20  # 🔚
 
 # --- Conditionals (Keywords) ---
-TT_KEYWORD_IF = 'KEYWORD_IF'      # 🤔
-TT_KEYWORD_ELIF = 'KEYWORD_ELIF'  # 🔀
-TT_KEYWORD_ELSE = 'KEYWORD_ELSE'  # 🤨
+TT_KEYWORD_IF = 21    # 🤔
+TT_KEYWORD_ELIF = 22  # 🔀
+TT_KEYWORD_ELSE = 23  # 🤨
 
 # --- Functions (Keywords) ---
-TT_KEYWORD_FUN = 'KEYWORD_FUN'        # 🧩
-TT_KEYWORD_RETURN = 'KEYWORD_RETURN'  # 🔙
-TT_KEYWORD_CALL = 'KEYWORD_CALL'      # 📞 (NOVO)
+TT_KEYWORD_FUN = 24     # 🧩
+TT_KEYWORD_RETURN = 25  # 🔙
+TT_KEYWORD_CALL = 26    # 📞 (NOVO)
 
 # --- Loops (Keywords) --- (NOVO)
-TT_KEYWORD_WHILE = 'KEYWORD_WHILE'  # ⏳ (NOVO)
-TT_KEYWORD_FOR = 'KEYWORD_FOR'      # 🚶 (NOVO)
+TT_KEYWORD_WHILE = 27  # ⏳ (NOVO)
+TT_KEYWORD_FOR = 28    # 🚶 (NOVO)
 
 # --- Logic & Comparison ---
-TT_COMP_EQ = 'COMP_EQ'      # ⚖️ (Equal to)
-TT_COMP_GT = 'COMP_GT'      # ⬆️ (Greater than)
-TT_COMP_LT = 'COMP_LT'      # ⬇️ (Less than)
-TT_LOGIC_NOT = 'LOGIC_NOT'  # 🚫 (Negation)
-TT_LOGIC_AND = 'LOGIC_AND'    # 🤝 (NOVO)
-TT_LOGIC_OR = 'LOGIC_OR'      # 🌀 (NOVO)
+TT_COMP_EQ = 29    # ⚖️ (Equal to)
+TT_COMP_GT = 30    # ⬆️ (Greater than)
+TT_COMP_LT = 31    # ⬇️ (Less than)
+TT_LOGIC_NOT = 32  # 🚫 (Negation)
+TT_LOGIC_AND = 33  # 🤝 (NOVO)
+TT_LOGIC_OR = 34   # 🌀 (NOVO)
 
 # --- Lists (Keywords) ---
-TT_KEYWORD_LIST = 'KEYWORD_LIST'      # 📜
-TT_KEYWORD_APPEND = 'KEYWORD_APPEND'  # ➕📜
-TT_KEYWORD_REMOVE = 'KEYWORD_REMOVE'  # ➖📜
-TT_KEYWORD_GET_AT = 'KEYWORD_GET_AT'  # 🎯 (NOVO)
+TT_KEYWORD_LIST = 35    # 📜
+TT_KEYWORD_APPEND = 36  # ➕📜
+TT_KEYWORD_REMOVE = 37  # ➖📜
+TT_KEYWORD_GET_AT = 38  # 🎯 (NOVO)
 
 # --- System (Keywords) ---
-TT_KEYWORD_IMPORT = 'KEYWORD_IMPORT'  # ⚙️
-TT_KEYWORD_SAVE = 'KEYWORD_SAVE'      # 💾
-TT_KEYWORD_SLEEP = 'KEYWORD_SLEEP'    # ⏱️
-TT_KEYWORD_READ_FILE = 'KEYWORD_READ_FILE'    # 📖 (NOVO)
-TT_KEYWORD_APPEND_FILE = 'KEYWORD_APPEND_FILE'  # ✍️ (NOVO)
+TT_KEYWORD_IMPORT = 39       # ⚙️
+TT_KEYWORD_SAVE = 40         # 💾
+TT_KEYWORD_SLEEP = 41        # ⏱️
+TT_KEYWORD_READ_FILE = 42    # 📖 (NOVO)
+TT_KEYWORD_APPEND_FILE = 43  # ✍️ (NOVO)
+
+# Name of each token type, indexed by its value (e.g., TT_NAMES[TT_OP_PLUS] == 'OP_PLUS')
+TT_NAMES = (
+    'IDENTIFIER', 'LIT_INT', 'LIT_REAL', 'LIT_STRING', 'EOF', 'PROGRAM_START',
+    'PROGRAM_END', 'BLOCK_START', 'BLOCK_END', 'KEYWORD_INT', 'KEYWORD_REAL',
+    'KEYWORD_STRING', 'KEYWORD_READ', 'KEYWORD_PRINT', 'OP_PLUS', 'OP_MINUS',
+    'OP_MUL', 'OP_DIV', 'ASSIGN', 'COMMENT', 'END_STATEMENT', 'KEYWORD_IF',
+    'KEYWORD_ELIF', 'KEYWORD_ELSE', 'KEYWORD_FUN', 'KEYWORD_RETURN',
+    'KEYWORD_CALL', 'KEYWORD_WHILE', 'KEYWORD_FOR', 'COMP_EQ', 'COMP_GT',
+    'COMP_LT', 'LOGIC_NOT', 'LOGIC_AND', 'LOGIC_OR', 'KEYWORD_LIST',
+    'KEYWORD_APPEND', 'KEYWORD_REMOVE', 'KEYWORD_GET_AT', 'KEYWORD_IMPORT',
+    'KEYWORD_SAVE', 'KEYWORD_SLEEP', 'KEYWORD_READ_FILE',
+    'KEYWORD_APPEND_FILE',
+)
 
 
 ################################################################################
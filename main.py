@@ -1,10 +1,6 @@
 # main.py
 
 import sys
-import os
-from Moji.lexer import Lexer
-from Moji.parser import Parser, SyntaxError
-from Moji.interpreter import Interpreter, RuntimeError
 
 
 def main():
@@ -15,15 +11,14 @@ def main():
 
     filepath = sys.argv[1]
 
-    # 2. Check if the file exists
-    if not os.path.exists(filepath):
-        print(f"Error: File not found at '{filepath}'")
-        sys.exit(1)
-
-    # 3. Read the code from the file (with UTF-8 encoding for emojis)
+    # 2. Read the code from the file (with UTF-8 encoding for emojis).
+    # Opening it is also the existence check (no separate stat of the path)
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             code = f.read()
+    except FileNotFoundError:
+        print(f"Error: File not found at '{filepath}'")
+        sys.exit(1)
     except Exception as e:
         print(f"Error reading the file: {e}")
         sys.exit(1)
@@ -32,7 +27,13 @@ def main():
         print("File is empty.")
         return
 
-    # 4. Run the pipeline (Lexer -> Parser -> Interpreter)
+    # 3. Run the pipeline (Lexer -> Parser -> Interpreter)
+    # Imported only now, so the usage/file errors above don't wait for the
+    # whole interpreter to load
+    from Moji.lexer import Lexer
+    from Moji.parser import Parser, MojiSyntaxError
+    from Moji.interpreter import Interpreter, RuntimeError
+
     try:
         # Lexer
         lexer = Lexer(code)
@@ -46,7 +47,7 @@ def main():
         interpreter = Interpreter()
         interpreter.run(ast)
 
-    except SyntaxError as e:
+    except MojiSyntaxError as e:
         # Error caught by the Parser
         print(f"!!! Syntax Error !!!")
         print(e)
@@ -0,0 +1,170 @@
+# tests/test_regressions.py
+
+"""
+Regression tests for behaviour the interpreter must keep while it is
+optimized. Run from the repository root with:
+
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from Moji.lexer import Lexer
+from Moji.parser import Parser, MojiSyntaxError
+from Moji.interpreter import Interpreter, RuntimeError
+from Moji.optimizer import fold_constants, MAX_FOLDED_LENGTH
+from Moji.ast_nodes import NumberNode, StringNode, BinOpNode
+from Moji.token import TT_KEYWORD_PRINT
+
+
+def parse(code):
+    """ Lexes and parses 'code', returning the ProgramNode. """
+    return Parser(Lexer(code).make_tokens()).parse()
+
+
+def run(code):
+    """ Runs a Moji program and returns what it printed. """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        Interpreter().run(parse(code))
+    return output.getvalue()
+
+
+class ForLoopTests(unittest.TestCase):
+    def test_loop_variable_restored_after_return(self):
+        code = """
+        🌱
+        📜 l 🔚 l ➕📜 1 🔚 l ➕📜 2 🔚
+        🔢 x 👉 5 🔚
+        🧩 f 📦 🚶 x l 📦 🔙 x 🔚 📦⛔ 📦⛔
+        🖨️ 📞 f 🔚
+        🖨️ x 🔚
+        🌳
+        """
+        self.assertEqual(run(code), "1\n5\n")
+
+    def test_undeclared_loop_variable_removed_after_return(self):
+        code = """
+        🌱
+        📜 l 🔚 l ➕📜 1 🔚
+        🧩 f 📦 🚶 x l 📦 🔙 x 🔚 📦⛔ 📦⛔
+        🖨️ 📞 f 🔚
+        🖨️ x 🔚
+        🌳
+        """
+        with self.assertRaises(RuntimeError):
+            run(code)
+
+
+class FunctionTests(unittest.TestCase):
+    def test_none_return_value_is_readable(self):
+        code = """
+        🌱
+        🧩 f 📦 📦⛔
+        🔢 y 👉 📞 f 🔚
+        🖨️ y 🔚
+        🧩 g 📦 🔙 🔚 📦⛔
+        🖨️ 📞 g 🔚
+        🌳
+        """
+        self.assertEqual(run(code), "None\nNone\n")
+
+
+class LexerTests(unittest.TestCase):
+    def test_keywords_without_variation_selector(self):
+        with_vs16 = Lexer('🖨️ "a" 🔚').make_tokens()
+        without_vs16 = Lexer('🖨 "a" 🔚').make_tokens()
+        self.assertEqual([token.type for token in without_vs16],
+                         [token.type for token in with_vs16])
+        self.assertEqual(without_vs16[0].type, TT_KEYWORD_PRINT)
+        self.assertEqual(run('🌱 🖨 "a" 🔚 🌳'), "a\n")
+
+
+class SyntaxErrorTests(unittest.TestCase):
+    def test_moji_syntax_error(self):
+        with self.assertRaises(MojiSyntaxError) as caught:
+            parse("🌱 🖨️ 🔚")
+        # Named so it doesn't shadow (or get caught as) Python's SyntaxError
+        self.assertNotIsInstance(caught.exception, SyntaxError)
+        self.assertTrue(str(caught.exception).startswith("Syntax Error: "))
+
+    def test_code_after_program_end(self):
+        with self.assertRaises(MojiSyntaxError) as caught:
+            parse("🌱 🌳 🖨️")
+        self.assertEqual(str(caught.exception), "Syntax Error: Code found after program end '🌳'.")
+
+
+class ConstantFoldingTests(unittest.TestCase):
+    def fold_print(self, code):
+        """ Folds a program with a single 🖨️ and returns the printed node. """
+        program = fold_constants(parse(code))
+        return program.statements[0].node_to_print
+
+    def test_arithmetic_is_folded(self):
+        node = self.fold_print("🌱 🖨️ 2 ✖️ 3 ➕ 4 🔚 🌳")
+        self.assertIsInstance(node, NumberNode)
+        self.assertEqual(node.value, 10)
+
+    def test_short_repetition_is_folded(self):
+        node = self.fold_print('🌱 🖨️ "-" ✖️ 40 🔚 🌳')
+        self.assertIsInstance(node, StringNode)
+        self.assertEqual(node.value, "-" * 40)
+
+    def test_long_repetition_is_left_for_runtime(self):
+        count = MAX_FOLDED_LENGTH + 1
+        code = f'🌱 🖨️ "-" ✖️ {count} 🔚 🌳'
+        self.assertIsInstance(self.fold_print(code), BinOpNode)
+        self.assertEqual(run(code), "-" * count + "\n")
+
+    def test_division_by_zero_is_not_folded(self):
+        # The error must only happen if the code is reached
+        code = '🌱 🔢 x 👉 0 🔚 🤔 x ⚖️ 1 📦 🖨️ 1 ➗ 0 🔚 📦⛔ 🖨️ "ok" 🔚 🌳'
+        self.assertEqual(run(code), "ok\n")
+
+
+class FileTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def read(self, name):
+        with open(self.path(name), encoding='utf-8') as f:
+            return f.read()
+
+    def test_save_then_append(self):
+        target = self.path("a.txt")
+        run(f'🌱 💾 "x" "{target}" 🔚 ✍️ "y" "{target}" 🔚 🌳')
+        self.assertEqual(self.read("a.txt"), "xy")
+
+    def test_save_overwrites(self):
+        target = self.path("a.txt")
+        run(f'🌱 💾 "old" "{target}" 🔚 💾 "new" "{target}" 🔚 🌳')
+        self.assertEqual(self.read("a.txt"), "new")
+
+    def test_append_through_aliased_path(self):
+        target = self.path("a.txt")
+        alias = self.path("b.txt")
+        with open(target, 'w', encoding='utf-8'):
+            pass
+        try:
+            os.symlink(target, alias)
+        except (OSError, NotImplementedError):
+            self.skipTest("symlinks are not available")
+        run(f'🌱 💾 "x" "{target}" 🔚 ✍️ "y" "{alias}" 🔚 🌳')
+        self.assertEqual(self.read("a.txt"), "xy")
+
+    def test_file_is_readable_right_after_save(self):
+        target = self.path("a.txt")
+        code = f'🌱 💾 "x" "{target}" 🔚 🖨️ 📖 "{target}" 🔚 🌳'
+        self.assertEqual(run(code), "x\n")
+
+
+if __name__ == '__main__':
+    unittest.main()